@@ -117,7 +117,7 @@ class Admin(commands.Cog):
         """
 
         list_of_commands = list(self.walk_commands())
-        longest_command_name = sorted((len(x.qualified_name) for x in list_of_commands), reverse=True)[0]
+        longest_command_name = max(len(x.qualified_name) for x in list_of_commands)
         help_string = f'```Admin Cog.\n\nCommands:'
 
         for command in list_of_commands:
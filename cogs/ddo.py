@@ -217,11 +217,11 @@ class DDO(commands.Cog):
 
         # Search each element to see if it contains the data we're interested in
         for string in string_elements:
-            if string.find('Enchantments') != -1:
+            if 'Enchantments' in string:
                 enchantment_string = string
-            elif string.lower().find('minimum level') != -1:
+            elif 'minimum level' in string.lower():
                 minimum_level_string = string
-            elif string.find('Item Type') != -1 or string.find('Weapon Type') != -1:
+            elif 'Item Type' in string or 'Weapon Type' in string:
                 item_type_string = string
 
         # If we did not find an enchantments element, return an error
@@ -245,15 +245,15 @@ class DDO(commands.Cog):
         for element in rows:
             if element != '':
                 # 'pure' elements have no tooltip or any other html tags
-                if element.find('has_tooltip') == -1 and element.find('</a>') == -1:
+                if 'has_tooltip' not in element and '</a>' not in element:
                     if element != '</li>':
                         # Clean up element from whitespace and tags
                         result = (element.replace('</li>', '').replace('\n', '').replace('<ul>', ''))
                         # Weird case where an augment slips through
-                        if result != '' and result.find('Elemental damage') == -1:
+                        if result != '' and 'Elemental damage' not in result:
                             enchantments.append(result)
                 # If the element has a tooltip, do some regex magic
-                elif element.find('has_tooltip') != -1:
+                elif 'has_tooltip' in element:
                     # Enchantment description is always before the first closing '</a>'
                     # Positive Lookahead for the fewest number of characters
                     # These characters are always preceded by a word or a digit
@@ -263,7 +263,7 @@ class DDO(commands.Cog):
                     # Note: This description was written 'backwards', (positive lookbehind occurs first, etc.)
                     result = search("(?<=>)( )*(\+\d+ )*(\w|\d)(.+?)(?=</a>)", element)
                     # If our result is not a Mythic Bonus (these are on nearly every single item), add it
-                    if result and str(result.group(0)).find('Mythic') == -1:
+                    if result and 'Mythic' not in str(result.group(0)):
                         enchantments.append(result.group(0).strip())
 
         # Prep other detail variables
@@ -282,7 +282,7 @@ class DDO(commands.Cog):
 
         # Check for Attuned to Heroism, as this is coded strangely
         for index in range(len(enchantments)):
-            if enchantments[index].find('Attuned to Heroism') != -1:
+            if 'Attuned to Heroism' in enchantments[index]:
                 # If Attuned to Heroism is an enchantment, remove all sub-enchantments from the final list
                 enchantments = enchantments[0:index + 1]
                 break
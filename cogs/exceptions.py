@@ -112,7 +112,7 @@ class Exceptions(commands.Cog):
                 await ctx.author.send(f'{ctx.command} can not be used in Private Messages.')
                 return
             except HTTPException as e:
-                print(f'Commands Error Handler Error: (NoPrivateMessage) {e}')
+                bot_logger.error(f'Commands Error Handler Error (NoPrivateMessage). {e.status}. {e.text}')
 
         # Using the permissions tuple allows us to handle multiple errors of similar types
         # Errors where the user does not have the authority to execute the command
@@ -238,14 +238,13 @@ class Exceptions(commands.Cog):
 
         assert ctx.guild is not None
 
+        # most guilds don't enable direct invocation; reject those with a single cached lookup before any other work
+        if not self.bot.cache.guild_feature_enabled(ctx.guild.id, GuildFeature.TAG_DIRECT_INVOKE):
+            return
+
         tag_cog = self.bot.get_cog('Tags')
-        direct_invoke_enabled = self.bot.cache.guild_feature_enabled(ctx.guild.id, GuildFeature.TAG_DIRECT_INVOKE)
 
-        if (
-            tag_cog is None or
-            not direct_invoke_enabled or
-            not hasattr(tag_cog, 'get_tag')
-        ):
+        if tag_cog is None or not hasattr(tag_cog, 'get_tag'):
             return
 
         potential_tag = ctx.message.content.removeprefix(ctx.prefix or self.bot.default_prefix)
@@ -22,10 +22,14 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from collections import defaultdict
+from collections import OrderedDict
 from contextlib import suppress
+from functools import partial
+from itertools import accumulate, takewhile
+from operator import itemgetter, ge
 from random import choice as random_choice
-from typing import Optional, Dict, List, Tuple
+from time import time
+from typing import Optional, Dict, List, Callable, Iterator, Tuple, Iterable
 
 import aiosqlite
 import discord
@@ -33,7 +37,6 @@ from aiosqlite import Error as aiosqliteError, IntegrityError
 from discord import app_commands, Interaction
 from discord.app_commands import Choice, Range
 from discord.ext import commands
-from discord.utils import utcnow
 
 from dreambot import DreamBot
 from utils.checks import InvocationCheckFailure
@@ -43,6 +46,8 @@ from utils.intermediate_models.composite_group import CompositeGroup
 from utils.logging_formatter import bot_logger
 from utils.utils import format_unix_dt, generate_autocomplete_choices
 
+AutocompleteFilter = Callable[[Dict[str, CompositeGroup], discord.Member], Iterator[str]]
+
 
 # TODO: Groups v3 -> edit group (max_members); needs components for confirmation when new max_members < current_members
 
@@ -51,10 +56,19 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
     """
     A Cogs class that contains Groups commands for the bot.
 
+    Constants:
+        AUTOCOMPLETE_CACHE_SIZE (int): The maximum number of filtered autocomplete option sets to keep per guild.
+
     Attributes:
         bot (DreamBot): The Discord bot class.
+        groups (Dict[int, Dict[str, CompositeGroup]]): A Guild.id: [Group.name: CompositeGroup] mapping.
+        autocomplete_cache (Dict[int, OrderedDict[Tuple[str, int, bool], Tuple[str, ...]]]): A Guild.id: filtered
+            autocomplete options mapping, in least-recently-used order. Cleared whenever the guild's groups change.
+        autocomplete_filters (Dict[str, AutocompleteFilter]): A Command.name: AutocompleteFilter mapping.
     """
 
+    AUTOCOMPLETE_CACHE_SIZE = 64
+
     def __init__(self, bot: DreamBot) -> None:
         """
         The constructor for the Groups class.
@@ -65,7 +79,18 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
 
         self.bot = bot
         # [guild_id: [group_name: CompositeGroup]]
-        self.groups: Dict[int, Dict[str, CompositeGroup]] = defaultdict(dict)
+        self.groups: Dict[int, Dict[str, CompositeGroup]] = {}
+        # [guild_id: [(command_name, user_id, is_moderator): options]]
+        self.autocomplete_cache: Dict[int, OrderedDict[Tuple[str, int, bool], Tuple[str, ...]]] = {}
+        # [command_name: AutocompleteFilter]
+        self.autocomplete_filters: Dict[str, AutocompleteFilter] = {
+            'delete': manageable_group_names,
+            'kick': manageable_group_names,
+            'transfer': manageable_group_names,
+            'join': joinable_group_names,
+            'leave': joined_group_names,
+            'view': all_group_names
+        }
 
     async def cog_load(self) -> None:
         """
@@ -85,7 +110,7 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
         )
 
         for group in groups:
-            self.groups[group.guild_id][group.group_name] = CompositeGroup(group)
+            self.groups.setdefault(group.guild_id, {})[group.group_name] = CompositeGroup(group)
 
         group_members = await typed_retrieve_query(
             self.bot.database,
@@ -94,7 +119,8 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
         )
 
         for group_member in group_members:
-            self.groups[group_member.guild_id][group_member.group_name].members.add(group_member.member_id)
+            self.groups[group_member.guild_id][group_member.group_name].joined[group_member.member_id] = \
+                group_member.joined
 
     @app_commands.checks.cooldown(1, 10.0, key=lambda i: (i.guild_id, i.user.id))
     @app_commands.command(name='create', description='Creates a new group')
@@ -126,13 +152,13 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
 
         assert interaction.guild_id is not None  # guild_only
 
-        if group_name in self.groups[interaction.guild_id]:
+        if group_name in self.groups.get(interaction.guild_id, {}):
             raise InvocationCheckFailure('A group with that name already exists.')
 
         group = Group(
             interaction.guild_id,
             interaction.user.id,
-            int(utcnow().timestamp()),
+            int(time()),
             group_name,
             max_members,
             0,
@@ -146,21 +172,24 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
                 group.unpack(),
                 errors_to_suppress=aiosqlite.IntegrityError
             )
-        except aiosqliteError as e:
-            if isinstance(e, IntegrityError):
-                await interaction.response.send_message('A group with that name already exists.', ephemeral=True)
-            else:
-                await interaction.response.send_message('Failed to create a new group.', ephemeral=True)
+        except IntegrityError:
+            await interaction.response.send_message('A group with that name already exists.', ephemeral=True)
+        except aiosqliteError:
+            await interaction.response.send_message('Failed to create a new group.', ephemeral=True)
         else:
+            # update the cache before responding; a failed response shouldn't leave the cache out of sync
+            composite_group = CompositeGroup(group)
+            self.groups.setdefault(interaction.guild_id, {})[group_name] = composite_group
+            self.invalidate_autocomplete(interaction.guild_id)
+
             if group.ephemeral_updates:
                 await interaction.response.send_message('Successfully created group.', ephemeral=True)
             else:
-                max_members_str = f'{group.max_members:,}' if group.max_members is not None else "∞"
                 await interaction.response.send_message(
-                    f'_{interaction.user.mention} created group "**{group_name}**" ({max_members_str} max members)_',
+                    f'_{interaction.user.mention} created group "**{group_name}**" '
+                    f'({composite_group.max_members_display} max members)_',
                     allowed_mentions=discord.AllowedMentions.none()
                 )
-            self.groups[interaction.guild_id][group_name] = CompositeGroup(group)
 
     @app_commands.checks.cooldown(1, 10.0, key=lambda i: (i.guild_id, i.user.id))
     @app_commands.command(name='delete', description='Deletes an existing group')
@@ -194,6 +223,11 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
         except aiosqliteError:
             await interaction.response.send_message('Failed to delete group.', ephemeral=True)
         else:
+            with suppress(KeyError):
+                del self.groups[interaction.guild_id][group_name]
+
+            self.invalidate_autocomplete(interaction.guild_id)
+
             if group.ephemeral_updates:
                 await interaction.response.send_message('Successfully deleted group.', ephemeral=True)
             else:
@@ -202,9 +236,6 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
                     allowed_mentions=discord.AllowedMentions.none()
                 )
 
-            with suppress(KeyError):
-                del self.groups[interaction.guild_id][group_name]
-
     @app_commands.checks.cooldown(1, 10.0, key=lambda i: (i.guild_id, i.user.id))
     @app_commands.command(name='join', description='Joins an existing group')
     @app_commands.describe(group_name="The name of the group you'd like to join")
@@ -226,37 +257,38 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
 
         group = self.get_group(interaction.guild_id, group_name)
 
-        if interaction.user.id in self.groups[interaction.guild_id][group_name].members:
+        if interaction.user.id in group.members:
             raise InvocationCheckFailure("You're already a member of this group!")
 
         if group.is_full:
             raise InvocationCheckFailure('That group is full!')
 
+        joined = int(time())
+
         try:
             await execute_query(
                 self.bot.database,
                 'INSERT INTO GROUP_MEMBERS VALUES (?, ?, ?, ?)',
-                (interaction.guild_id, interaction.user.id, int(utcnow().timestamp()), group_name),
+                (interaction.guild_id, interaction.user.id, joined, group_name),
                 errors_to_suppress=aiosqlite.IntegrityError
             )
-        except aiosqliteError as e:
-            if isinstance(e, IntegrityError):
-                await interaction.response.send_message("You're already a member of this group!", ephemeral=True)
-            else:
-                await interaction.response.send_message('Failed to join group.', ephemeral=True)
+        except IntegrityError:
+            await interaction.response.send_message("You're already a member of this group!", ephemeral=True)
+        except aiosqliteError:
+            await interaction.response.send_message('Failed to join group.', ephemeral=True)
         else:
+            group.add_member(interaction.user.id, joined)
+            self.invalidate_autocomplete(interaction.guild_id)
+
             if group.ephemeral_updates:
                 await interaction.response.send_message('Successfully joined group.', ephemeral=True)
             else:
-                max_members_str = f'{group.max_members:,}' if group.max_members is not None else "∞"
                 await interaction.response.send_message(
                     f'_{interaction.user.mention} joined group "**{group_name}**" '
-                    f'({group.current_members + 1:,}/{max_members_str} members)_',
+                    f'({group.current_members:,}/{group.max_members_display} members)_',
                     allowed_mentions=discord.AllowedMentions.none()
                 )
 
-            self.groups[interaction.guild_id][group_name].add_member(interaction.user.id)
-
     @app_commands.checks.cooldown(1, 10.0, key=lambda i: (i.guild_id, i.user.id))
     @app_commands.command(name='leave', description="Leaves a group you're an existing member of")
     @app_commands.describe(group_name="The name of the group you'd like to leave")
@@ -290,18 +322,18 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
         except aiosqliteError:
             await interaction.response.send_message('Failed to leave group.', ephemeral=True)
         else:
+            group.remove_member(interaction.user.id)
+            self.invalidate_autocomplete(interaction.guild_id)
+
             if group.ephemeral_updates:
                 await interaction.response.send_message('Successfully left group.', ephemeral=True)
             else:
-                max_members_str = f'{group.max_members:,}' if group.max_members is not None else "∞"
                 await interaction.response.send_message(
                     f'_{interaction.user.mention} left group "**{group_name}**" '
-                    f'({group.current_members - 1:,}/{max_members_str} members)_',
+                    f'({group.current_members:,}/{group.max_members_display} members)_',
                     allowed_mentions=discord.AllowedMentions.none()
                 )
 
-            self.groups[interaction.guild_id][group_name].remove_member(interaction.user.id)
-
     @app_commands.checks.cooldown(1, 10.0, key=lambda i: (i.guild_id, i.user.id))
     @app_commands.command(name='kick', description="Removes a member from an existing group")
     @app_commands.describe(group_name="The name of the group you'd like to remove a member from")
@@ -350,19 +382,18 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
         except aiosqliteError:
             await interaction.response.send_message('Failed to kick member from group.', ephemeral=True)
         else:
+            group.remove_member(member.id)
+            self.invalidate_autocomplete(interaction.guild_id)
+
             if group.ephemeral_updates:
                 await interaction.response.send_message('Successfully kicked member from group.', ephemeral=True)
             else:
-                max_members_str = f'{group.max_members:,}' if group.max_members is not None else "∞"
-
                 await interaction.response.send_message(
                     f'_{interaction.user.mention} removed {member.mention} from group "**{group_name}**" '
-                    f'({group.current_members - 1:,}/{max_members_str} members)_',
+                    f'({group.current_members:,}/{group.max_members_display} members)_',
                     allowed_mentions=discord.AllowedMentions(users=[member])
                 )
 
-            self.groups[interaction.guild_id][group_name].remove_member(member.id)
-
     @app_commands.checks.cooldown(1, 10.0, key=lambda i: (i.guild_id, i.user.id))
     @app_commands.command(name='transfer', description="Transfers group ownership to a new member")
     @app_commands.describe(group_name="The name of the group you'd like to transfer ownership of")
@@ -404,6 +435,9 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
         except aiosqliteError:
             await interaction.response.send_message('Failed to transfer group ownership.', ephemeral=True)
         else:
+            group.group.owner_id = member.id
+            self.invalidate_autocomplete(interaction.guild_id)
+
             if group.ephemeral_updates:
                 await interaction.response.send_message('Successfully transferred group ownership.', ephemeral=True)
             else:
@@ -413,8 +447,6 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
                     allowed_mentions=discord.AllowedMentions(users=[member, owner] if owner is not None else [member])
                 )
 
-            self.groups[interaction.guild_id][group_name].group.owner_id = member.id
-
     @app_commands.checks.cooldown(1, 10.0, key=lambda i: (i.guild_id, i.user.id))
     @app_commands.command(name='view', description='View an existing group')
     @app_commands.describe(group_name="The name of the group you'd like to view")
@@ -433,56 +465,51 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
         assert interaction.guild is not None  # guild_only
         assert interaction.guild_id is not None  # guild_only
 
-        group = self.get_group(interaction.guild_id, group_name).group
+        composite_group = self.get_group(interaction.guild_id, group_name)
+        group = composite_group.group
         owner = interaction.guild.get_member(group.owner_id)
         max_members_str = f'{group.max_members:,}' if group.max_members is not None else "None"
 
-        try:
-            group_members = await typed_retrieve_query(
-                self.bot.database,
-                GroupMember,
-                'SELECT * FROM GROUP_MEMBERS WHERE GUILD_ID=? AND GROUP_NAME=?',
-                (interaction.guild_id, group_name),
-            )
-        except aiosqliteError:
-            await interaction.response.send_message('Failed to fetch group members.', ephemeral=True)
+        # the cache is populated from (and kept in sync with) GROUP_MEMBERS, so there's no need to query the database
+        mentions: List[str] = []
+        joined_timestamps: List[int] = []
+        get_member = interaction.guild.get_member
+
+        for member_id, joined in sorted(composite_group.joined.items(), key=itemgetter(1)):
+            if fetched_member := get_member(member_id):
+                mentions.append(fetched_member.mention)
+                joined_timestamps.append(joined)
+
+        max_elements = calculate_member_and_joined_max_splice(mentions, joined_timestamps)
+
+        if not mentions:
+            members_field = 'None'
+            positions_field = '-'
+            joined_field = '-'
+        elif max_elements <= 0:
+            members_field = 'Error generating members field'
+            positions_field = 'N/A'
+            joined_field = 'N/A'
         else:
-            group_members.sort(key=lambda x: x.joined)
-            member_list = [
-                (fetched_member, member.joined) for member in group_members
-                if (fetched_member := interaction.guild.get_member(member.member_id))
-            ]
-
-            max_elements = calculate_member_and_joined_max_splice(member_list)
+            members_field = '\n'.join(mentions[:max_elements])
+            positions_field = '\n'.join(str(x) for x in range(1, max_elements + 1))
+            joined_field = '\n'.join(format_unix_dt(x, 'R') for x in joined_timestamps[:max_elements])
 
-            if not member_list:
-                members_field = 'None'
-                positions_field = '-'
-                joined_field = '-'
-            elif max_elements <= 0:
-                members_field = 'Error generating members field'
-                positions_field = 'N/A'
-                joined_field = 'N/A'
-            else:
-                members_field = '\n'.join(x[0].mention for x in member_list[:max_elements])
-                positions_field = '\n'.join(str(x) for x in range(1, max_elements + 1))
-                joined_field = '\n'.join(format_unix_dt(x[1], 'R') for x in member_list[:max_elements])
-
-            embed = discord.Embed(title=f'{group.group_name} Members', color=0x64d1ff)
-            embed.set_thumbnail(
-                url='https://cdn.discordapp.com/attachments/634530033754570762/1194039472514408479/group_icon.png'
-            )
-            embed.add_field(name='Owner', value=f'{owner.mention if owner is not None else "N/A"}')
-            embed.add_field(name='Created', value=format_unix_dt(group.created, 'R'))
-            embed.add_field(name='​', value='​')
-            embed.add_field(name='Current Members', value=f'{len(member_list):,}')
-            embed.add_field(name='Max Members', value=max_members_str)
-            embed.add_field(name='​', value='​')
-            embed.add_field(name='Members', value=members_field)
-            embed.add_field(name='Position', value=positions_field)
-            embed.add_field(name='Joined', value=joined_field)
-            embed.set_footer(text='Please report any issues to my owner!')
-            await interaction.response.send_message(embed=embed)
+        embed = discord.Embed(title=f'{group.group_name} Members', color=0x64d1ff)
+        embed.set_thumbnail(
+            url='https://cdn.discordapp.com/attachments/634530033754570762/1194039472514408479/group_icon.png'
+        )
+        embed.add_field(name='Owner', value=f'{owner.mention if owner is not None else "N/A"}')
+        embed.add_field(name='Created', value=format_unix_dt(group.created, 'R'))
+        embed.add_field(name='​', value='​')
+        embed.add_field(name='Current Members', value=f'{len(mentions):,}')
+        embed.add_field(name='Max Members', value=max_members_str)
+        embed.add_field(name='​', value='​')
+        embed.add_field(name='Members', value=members_field)
+        embed.add_field(name='Position', value=positions_field)
+        embed.add_field(name='Joined', value=joined_field)
+        embed.set_footer(text='Please report any issues to my owner!')
+        await interaction.response.send_message(embed=embed)
 
     """
     MARK: - Autocomplete Methods
@@ -512,11 +539,6 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
         assert interaction.guild_id is not None  # guild_only
         assert isinstance(interaction.user, discord.Member)  # guild_only
 
-        try:
-            groups = self.groups[interaction.guild_id].keys()
-        except AttributeError:
-            return []
-
         """
         Autocomplete Logic:
             Create -> None
@@ -528,32 +550,39 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
             View -> All
         """
 
-        if interaction.command.name in {'delete', 'kick', 'transfer'}:
-            if not interaction.user.guild_permissions.manage_messages:
-                options = [
-                    x for x in groups if self.groups[interaction.guild_id][x].group.owner_id == interaction.user.id
-                ]
-            else:
-                options = [x for x in groups]
-        elif interaction.command.name == 'join':
-            options = [
-                x for x in groups
-                if not self.groups[interaction.guild_id][x].is_full
-                   and interaction.user.id not in self.groups[interaction.guild_id][x].members
-            ]
-        elif interaction.command.name == 'leave':
-            options = [x for x in groups if interaction.user.id in self.groups[interaction.guild_id][x].members]
-        elif interaction.command.name == 'view':
-            options = [x for x in groups]
+        autocomplete_filter = self.autocomplete_filters.get(interaction.command.name)
+
+        if autocomplete_filter is None:
+            return []
+
+        # filtered options are reused across keystrokes until the guild's groups are modified
+        guild_cache = self.autocomplete_cache.get(interaction.guild_id)
+        cache_key = (
+            interaction.command.name,
+            interaction.user.id,
+            interaction.user.guild_permissions.manage_messages
+        )
+
+        if guild_cache is not None and cache_key in guild_cache:
+            guild_cache.move_to_end(cache_key)
+            options = guild_cache[cache_key]
         else:
-            options = []
+            options = tuple(autocomplete_filter(self.groups.get(interaction.guild_id, {}), interaction.user))
+            # only create a guild's entry once there is something to store in it
+            guild_cache = self.autocomplete_cache.setdefault(interaction.guild_id, OrderedDict())
+            guild_cache[cache_key] = options
+
+            # keep only the most recently used option sets for each guild
+            if len(guild_cache) > self.AUTOCOMPLETE_CACHE_SIZE:
+                guild_cache.popitem(last=False)
 
         if not current:
             return [Choice(name=x, value=x) for x in options[:25]]
 
         return generate_autocomplete_choices(
             current,
-            [(x, x) for x in options],
+            ((x, x) for x in options),
+            limit=25,
             minimum_threshold=100
         )
 
@@ -574,23 +603,23 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
         """
 
         # restore ownership if any groups remain unclaimed
-
         with suppress(aiosqliteError):
-            await execute_query(
+            restored = await execute_query(
                 self.bot.database,
                 'UPDATE GROUPS SET OWNER_ID=? WHERE GUILD_ID=? AND OWNER_ID=?',
                 (member.id, member.guild.id, -member.id)
             )
 
-            updated_group_names = await typed_retrieve_query(
-                self.bot.database,
-                str,
-                'SELECT GROUP_NAME FROM GROUPS WHERE OWNER_ID=? AND GUILD_ID=?',
-                (member.id, member.guild.id)
-            )
+            # the cache mirrors GROUPS, so apply the write to it rather than reading the affected groups back
+            unclaimed_groups = [
+                group for group in self.groups.get(member.guild.id, {}).values() if group.owner_id == -member.id
+            ]
 
-            for group_name in updated_group_names:
-                self.groups[member.guild.id][group_name].group.owner_id = member.id
+            for group in unclaimed_groups:
+                group.group.owner_id = member.id
+
+            if restored or unclaimed_groups:
+                self.invalidate_autocomplete(member.guild.id)
 
     @commands.Cog.listener()
     async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
@@ -605,43 +634,59 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
             None.
         """
 
+        # the cache mirrors GROUPS and GROUP_MEMBERS, so writes are applied to it rather than read back
+        guild_groups = self.groups.get(payload.guild_id, {})
+
         # set ownership to a sentinel value of -(user_id) for pseudo-tracking
 
         # group ownership
         with suppress(aiosqliteError):
-            await execute_query(
+            orphaned = await execute_query(
                 self.bot.database,
                 'UPDATE GROUPS SET OWNER_ID=? WHERE GUILD_ID=? AND OWNER_ID=?',
                 (-payload.user.id, payload.guild_id, payload.user.id)
             )
 
-            updated_group_names = await typed_retrieve_query(
-                self.bot.database,
-                str,
-                'SELECT GROUP_NAME FROM GROUPS WHERE OWNER_ID=? AND GUILD_ID=?',
-                (-payload.user.id, payload.guild_id)
-            )
+            owned_groups = [group for group in guild_groups.values() if group.owner_id == payload.user.id]
+
+            for group in owned_groups:
+                group.group.owner_id = -payload.user.id
 
-            for group_name in updated_group_names:
-                self.groups[payload.guild_id][group_name].group.owner_id = -payload.user.id
+            if orphaned or owned_groups:
+                self.invalidate_autocomplete(payload.guild_id)
 
         # group membership
         with suppress(aiosqliteError):
-            updated_group_names = await typed_retrieve_query(
-                self.bot.database,
-                str,
-                'SELECT GROUP_NAME FROM GROUP_MEMBERS WHERE GUILD_ID=? AND MEMBER_ID=?',
-                (payload.guild_id, payload.user.id)
-            )
-
-            await execute_query(
+            removed = await execute_query(
                 self.bot.database,
                 'DELETE FROM GROUP_MEMBERS WHERE GUILD_ID=? AND MEMBER_ID=?',
                 (payload.guild_id, payload.user.id)
             )
 
-            for group_name in updated_group_names:
-                self.groups[payload.guild_id][group_name].remove_member(payload.user.id)
+            joined_groups = [group for group in guild_groups.values() if payload.user.id in group.members]
+
+            for group in joined_groups:
+                group.remove_member(payload.user.id)
+
+            if removed or joined_groups:
+                self.invalidate_autocomplete(payload.guild_id)
+
+    """
+    MARK: - Cache Methods
+    """
+
+    def invalidate_autocomplete(self, guild_id: int) -> None:
+        """
+        Invalidates cached autocomplete options for the guild. Should be called whenever the guild's groups change.
+
+        Parameters:
+            guild_id (int): The id of the guild.
+
+        Returns:
+            None.
+        """
+
+        self.autocomplete_cache.pop(guild_id, None)
 
     """
     MARK: - Checks
@@ -662,10 +707,12 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
             (CompositeGroup): The relevant group for the invocation context.
         """
 
-        if group_name not in self.groups[guild_id]:
+        guild_groups = self.groups.get(guild_id)
+
+        if guild_groups is None or group_name not in guild_groups:
             raise InvocationCheckFailure('That group does not exist!')
 
-        return self.groups[guild_id][group_name]
+        return guild_groups[group_name]
 
     # noinspection PyMethodMayBeStatic
     def privileged_action_check(self, member: discord.Member, group_owner_id: int) -> None:
@@ -687,22 +734,90 @@ class Groups(commands.GroupCog, group_name='group', group_description='Commands
             raise InvocationCheckFailure('You do not own that group or do not have permission to manage groups.')
 
 
-def calculate_member_and_joined_max_splice(group_members: List[Tuple[discord.Member, int]]) -> int:
+def manageable_group_names(groups: Dict[str, CompositeGroup], member: discord.Member) -> Iterator[str]:
+    """
+    Yields the names of the groups the member is able to manage (owner or moderator).
+
+    Parameters:
+        groups (Dict[str, CompositeGroup]): The groups of the member's guild.
+        member (discord.Member): The member that invoked the autocomplete.
+
+    Yields:
+        (Iterator[str]): The names of the groups the member can manage.
+    """
+
+    if member.guild_permissions.manage_messages:
+        yield from groups
+    else:
+        yield from (name for name, group in groups.items() if group.owner_id == member.id)
+
+
+def joinable_group_names(groups: Dict[str, CompositeGroup], member: discord.Member) -> Iterator[str]:
+    """
+    Yields the names of the groups the member is able to join (not full and not already a member).
+
+    Parameters:
+        groups (Dict[str, CompositeGroup]): The groups of the member's guild.
+        member (discord.Member): The member that invoked the autocomplete.
+
+    Yields:
+        (Iterator[str]): The names of the groups the member can join.
+    """
+
+    yield from (name for name, group in groups.items() if not group.is_full and member.id not in group.members)
+
+
+def joined_group_names(groups: Dict[str, CompositeGroup], member: discord.Member) -> Iterator[str]:
+    """
+    Yields the names of the groups the member has already joined.
+
+    Parameters:
+        groups (Dict[str, CompositeGroup]): The groups of the member's guild.
+        member (discord.Member): The member that invoked the autocomplete.
+
+    Yields:
+        (Iterator[str]): The names of the groups the member has joined.
+    """
+
+    yield from (name for name, group in groups.items() if member.id in group.members)
+
+
+# noinspection PyUnusedLocal
+def all_group_names(groups: Dict[str, CompositeGroup], member: discord.Member) -> Iterator[str]:
+    """
+    Yields the names of all groups in the guild.
+
+    Parameters:
+        groups (Dict[str, CompositeGroup]): The groups of the member's guild.
+        member (discord.Member): The member that invoked the autocomplete.
+
+    Yields:
+        (Iterator[str]): The names of all groups.
+    """
+
+    yield from groups
+
+
+def calculate_member_and_joined_max_splice(mentions: List[str], joined_timestamps: List[int]) -> int:
     """
     Calculates the maximum splice of the member and joined embed fields.
 
     Parameters:
-        group_members (List[GroupMember]): The list of group members to format.
+        mentions (List[str]): The mentions of the group members to format.
+        joined_timestamps (List[int]): The joined timestamps of the group members to format.
 
     Returns:
         (int) The maximum splice of fields.
     """
 
-    if not group_members:
+    if not mentions:
         return -1
 
-    last_member_index = find_last_index_under_threshold([x[0].mention for x in group_members])
-    last_timestamp_index = find_last_index_under_threshold([str(x[1]) for x in group_members])
+    last_member_index = find_last_index_under_threshold(mentions)
+    # measure the decimal length of each raw joined timestamp, without materializing the strings in a throwaway list
+    last_timestamp_index = find_last_length_index_under_threshold(
+        (len(str(x)) for x in joined_timestamps), len(joined_timestamps)
+    )
 
     return min(last_member_index, last_timestamp_index)
 
@@ -718,16 +833,29 @@ def find_last_index_under_threshold(collection: List[str]) -> int:
         (Optional[int]): The index of the last viable element, if any.
     """
 
-    running_total = 0
+    return find_last_length_index_under_threshold((len(element) for element in collection), len(collection))
 
-    for index, element in enumerate(collection):
-        # +1 for future newline
-        if running_total + len(element) + 1 <= 1024:
-            running_total += len(element) + 1
-        else:
-            return index - 1
 
-    return len(collection)
+def find_last_length_index_under_threshold(lengths: Iterable[int], count: int) -> int:
+    """
+    Finds the last element (index) that would allow the collection to remain under the embed field limit (1024),
+    given only the lengths of the collection's elements.
+
+    Parameters:
+        lengths (Iterable[int]): The lengths of the elements to examine.
+        count (int): The number of elements in the collection.
+
+    Returns:
+        (Optional[int]): The index of the last viable element, if any.
+    """
+
+    # running totals are monotonically increasing, so count them lazily until the first one exceeds the limit
+    # +1 for future newline
+    # ge(1024, total) is evaluated in C, rather than entering a Python lambda frame for every element
+    running_totals = accumulate(length + 1 for length in lengths)
+    viable_elements = len(list(takewhile(partial(ge, 1024), running_totals)))
+
+    return viable_elements - 1 if viable_elements < count else count
 
 
 async def setup(bot: DreamBot) -> None:
@@ -31,7 +31,7 @@ from discord.ext import commands
 
 from dreambot import DreamBot
 from utils.database.helpers import execute_query
-from utils.enums.guild_feature import GuildFeature, has_guild_feature, set_guild_feature
+from utils.enums.guild_feature import GuildFeature, GUILD_FEATURE_MASKS, set_guild_feature
 from utils.logging_formatter import bot_logger
 
 
@@ -87,10 +87,8 @@ class GuildFeatures(commands.Cog):
             color=0x00BD96,
         )
 
-        for feature in GuildFeature:
-            embed.add_field(
-                name=f'{feature.name}', value='Enabled' if has_guild_feature(features, feature) else 'Disabled'
-            )
+        for name, mask in GUILD_FEATURE_MASKS:
+            embed.add_field(name=name, value='Enabled' if features & mask else 'Disabled')
 
         embed.set_footer(text='Please report any issues to my owner!')
 
@@ -122,15 +120,18 @@ class GuildFeatures(commands.Cog):
             GuildFeature.TAG_DIRECT_INVOKE: direct_tag_invoke
         }
 
-        if all(x is None for x in feature_mapping.values()):
-            await interaction.response.send_message('No guild features were modified.', ephemeral=True)
-            return
-
-        features = self.bot.cache.guild_features.get(interaction.guild_id, 0)
+        guild_features = self.bot.cache.guild_features
+        current_features = guild_features.get(interaction.guild_id, 0)
+        features = current_features
 
         for feature, value in feature_mapping.items():
             features = set_guild_feature(features, feature, value)
 
+        # covers both omitted arguments and values that match the current state; either way, skip the write
+        if features == current_features:
+            await interaction.response.send_message('No guild features were modified.', ephemeral=True)
+            return
+
         try:
             await execute_query(
                 self.bot.database,
@@ -142,7 +143,7 @@ class GuildFeatures(commands.Cog):
             await interaction.response.send_message('Failed to modify guild features as requested.', ephemeral=True)
         else:
             await interaction.response.send_message('Successfully modified guild features.', ephemeral=True)
-            self.bot.cache.guild_features[interaction.guild_id] = features
+            guild_features[interaction.guild_id] = features
 
 
 async def setup(bot: DreamBot) -> None:
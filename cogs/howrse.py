@@ -30,6 +30,11 @@ from utils.checks import guild_only
 from utils.context import Context
 from utils.logging_formatter import bot_logger
 
+# the embeds are constant; build them once rather than on every invocation
+CROSS_COUNTRY_EMBED = discord.Embed().set_image(url='https://media.giphy.com/media/sNH6OwnLEcxRnOlbLA/giphy.gif')
+FILL_IN_EMBED = discord.Embed().set_image(url='https://media.giphy.com/media/KKreoxYTGq3aRCbRLh/giphy.gif')
+WINS_EMBED = discord.Embed().set_image(url='https://media.tenor.com/Np6Be0U7BocAAAAC/groove-i-win.gif')
+
 
 class Howrse(commands.Cog):
     """
@@ -65,9 +70,7 @@ class Howrse(commands.Cog):
         """
 
         content = '@here\nFills in Cross-Country please! ♡'
-        embed = discord.Embed()
-        embed.set_image(url='https://media.giphy.com/media/sNH6OwnLEcxRnOlbLA/giphy.gif')
-        await ctx.send(content=content, embed=embed)
+        await ctx.send(content=content, embed=CROSS_COUNTRY_EMBED)
 
     @guild_only(1127457916992110735)
     @commands.command(name='wins', hidden=True)
@@ -99,9 +102,7 @@ class Howrse(commands.Cog):
         """
 
         content = '@here\nFills in Western Pleasure please! ♡'
-        embed = discord.Embed()
-        embed.set_image(url='https://media.giphy.com/media/KKreoxYTGq3aRCbRLh/giphy.gif')
-        await ctx.send(content=content, embed=embed)
+        await ctx.send(content=content, embed=FILL_IN_EMBED)
 
     @guild_only(1165414326417502218)
     @commands.command(name='xc', hidden=True)
@@ -117,9 +118,7 @@ class Howrse(commands.Cog):
         """
 
         content = '@here Fills in Cross-Country please! ♡'
-        embed = discord.Embed()
-        embed.set_image(url='https://media.giphy.com/media/sNH6OwnLEcxRnOlbLA/giphy.gif')
-        await ctx.send(content=content, embed=embed)
+        await ctx.send(content=content, embed=CROSS_COUNTRY_EMBED)
 
     @guild_only(1165414326417502218)
     @commands.command(name='c', hidden=True)
@@ -135,9 +134,7 @@ class Howrse(commands.Cog):
         """
 
         content = '@here Fills in Cutting please! ♡'
-        embed = discord.Embed()
-        embed.set_image(url='https://media.giphy.com/media/KKreoxYTGq3aRCbRLh/giphy.gif')
-        await ctx.send(content=content, embed=embed)
+        await ctx.send(content=content, embed=FILL_IN_EMBED)
 
     @guild_only(1165414326417502218)
     @commands.command(name='w', hidden=True)
@@ -153,9 +150,7 @@ class Howrse(commands.Cog):
         """
 
         content = 'Thank you for wins! ♡'
-        embed = discord.Embed()
-        embed.set_image(url='https://media.tenor.com/Np6Be0U7BocAAAAC/groove-i-win.gif')
-        await ctx.send(content=content, embed=embed)
+        await ctx.send(content=content, embed=WINS_EMBED)
 
 
 async def setup(bot: DreamBot) -> None:
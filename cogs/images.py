@@ -22,15 +22,20 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Union
+import asyncio
+from collections import OrderedDict
+from io import BytesIO
+from typing import Union, Tuple
 
 import discord
+from aiohttp import ClientResponseError
 from discord.ext import commands
 
 from dreambot import DreamBot
 from utils import image_utils
 from utils.context import Context
 from utils.defaults import MessageReply
+from utils.expiring_dict import ExpiringDict
 from utils.logging_formatter import bot_logger
 
 
@@ -38,20 +43,33 @@ class Images(commands.Cog):
     """
     A Cogs class that invokes ImageUtils methods.
 
+    Constants:
+        TITLE_CARD_CACHE_SIZE (int): The maximum number of rendered title cards to keep in memory.
+        FAILED_DOWNLOAD_TTL (int): How long (in seconds) to remember urls that could not be found or accessed.
+
     Attributes:
         bot (DreamBot): The Discord bot class.
+        title_cards (OrderedDict[str, bytes]): A Title: Title Card (PNG) mapping, in least-recently-used order.
+        failed_downloads (ExpiringDict[str, Tuple[int, str]]): A Url: (Status, Message) mapping for recent 403/404
+            responses.
     """
 
+    TITLE_CARD_CACHE_SIZE = 32
+    FAILED_DOWNLOAD_TTL = 10
+
     def __init__(self, bot: DreamBot) -> None:
         """
-        The constructor for the MemeCoin class.
+        The constructor for the Images class.
 
         Parameters:
             bot (DreamBot): The Discord bot.
         """
 
         self.bot = bot
+        self.title_cards: OrderedDict[str, bytes] = OrderedDict()
+        self.failed_downloads: ExpiringDict[str, Tuple[int, str]] = ExpiringDict(self.FAILED_DOWNLOAD_TTL)
 
+    @commands.cooldown(3, 6, commands.BucketType.user)
     @commands.command(name='invert')
     async def invert(self, ctx: Context, source: Union[discord.Message, str] = MessageReply) -> None:
         """
@@ -69,10 +87,28 @@ class Images(commands.Cog):
             None.
         """
 
+        # don't trigger typing for sources that can be rejected locally
+        if not image_utils.is_image_source(source):
+            await ctx.send('No image was provided.')
+            return
+
+        # users tend to retry bad links (typos, expired cdn urls); don't re-request a url that just failed
+        if isinstance(source, str) and (failed_download := self.failed_downloads.get(source)) is not None:
+            status, message = failed_download
+            self.bot.report_command_failure(ctx)
+            await ctx.send(f'`{ctx.command}` encountered a network error: `{message} ({status})`')
+            return
+
         async with ctx.channel.typing():
             try:
                 buffer = await image_utils.extract_image_as_bytes(self.bot.session, source)
                 inverted = await image_utils.invert_object(buffer)
+            except ClientResponseError as e:
+                self.bot.report_command_failure(ctx)
+                if isinstance(source, str) and e.status in (403, 404):
+                    # store only the details; the exception would keep this invocation's frames alive
+                    self.failed_downloads[source] = (e.status, e.message)
+                raise
             except image_utils.NoImage:
                 await ctx.send('No image was provided.')
                 return
@@ -80,6 +116,10 @@ class Images(commands.Cog):
                 self.bot.report_command_failure(ctx)
                 await ctx.send('The supplied image is too large. Bots are limited to images of size < 8 Megabytes.')
                 return
+            except asyncio.TimeoutError:
+                self.bot.report_command_failure(ctx)
+                await ctx.send('Could not download image. The request timed out.')
+                return
             except discord.HTTPException as e:
                 self.bot.report_command_failure(ctx)
                 bot_logger.error(f'File Download Failure. {e.status}. {e.text}')
@@ -95,6 +135,7 @@ class Images(commands.Cog):
             else:
                 self.bot.reset_dynamic_cooldown(ctx)
 
+    @commands.cooldown(3, 6, commands.BucketType.user)
     @commands.command(name='iasip', aliases=['sun', 'sunny', 'title'])
     async def iasip_title_card(self, ctx: Context, *, title: str) -> None:
         """
@@ -119,7 +160,17 @@ class Images(commands.Cog):
             if not title.endswith('"'):
                 title += '"'
 
-            buffer = await image_utils.title_card_generator(title)
+            # rendering takes hundreds of milliseconds, and popular titles tend to be requested repeatedly
+            if (title_card := self.title_cards.get(title)) is not None:
+                self.title_cards.move_to_end(title)
+            else:
+                title_card = (await image_utils.title_card_generator(title)).getvalue()
+                self.title_cards[title] = title_card
+
+                if len(self.title_cards) > self.TITLE_CARD_CACHE_SIZE:
+                    self.title_cards.popitem(last=False)
+
+            buffer = BytesIO(title_card)
 
             try:
                 await ctx.send(file=discord.File(buffer, filename="iasip.png"))
@@ -75,12 +75,13 @@ class LostArk(commands.Cog):
 
         party_size -= 1  # split does not include winning bidder
 
-        bidding_breakpoint = int((.95 * market_price * party_size) / (1 + .95 * party_size))
+        # .95 = 19/20, so multiplying through by 20 keeps the calculation in exact integer arithmetic
+        bidding_breakpoint = (19 * market_price * party_size) // (20 + 19 * party_size)
 
         await interaction.response.send_message(
-            f'For an item with a market value of {"{:,}".format(market_price)} and a party size of {party_size + 1}, '
+            f'For an item with a market value of {market_price:,} and a party size of {party_size + 1}, '
             f'you should continue to bid while the next minimum bid price is less than '
-            f'**{"{:,}".format(bidding_breakpoint)}**.'
+            f'**{bidding_breakpoint:,}**.'
         )
 
 
@@ -22,8 +22,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from asyncio import gather
 from contextlib import suppress
-from re import findall, sub
+from re import compile as re_compile
 from typing import Union, Optional, Literal
 
 import discord
@@ -33,13 +34,14 @@ from discord.ext import commands
 from dreambot import DreamBot
 from utils.context import Context
 from utils.converters import AggressiveDefaultMemberConverter
-from utils.database.helpers import execute_query, typed_retrieve_query
+from utils.database.helpers import execute_query
 from utils.logging_formatter import bot_logger
 
 CHANNEL_OBJECT = Union[discord.TextChannel, discord.CategoryChannel, discord.VoiceChannel]
 PERMISSIONS_PARENT = Union[discord.Role, discord.Member]
 PURGEABLE_INSTANCES = (discord.StageChannel, discord.TextChannel, discord.Thread, discord.VoiceChannel)
 PURGEABLE_TYPE = Union[discord.StageChannel, discord.TextChannel, discord.Thread, discord.VoiceChannel]
+MEMBER_PATTERN = re_compile(r'(?:<@!?)?([0-9]{15,19})>?|(\S.{1,31}?#[0-9]{4})')
 
 
 class Moderation(commands.Cog):
@@ -98,12 +100,13 @@ class Moderation(commands.Cog):
             None.
         """
 
-        if not isinstance(ctx.channel, PURGEABLE_INSTANCES):
+        if not isinstance(ctx.channel, PURGEABLE_INSTANCES) or (isinstance(limit, int) and limit < 0):
             return
 
-        confirmation = ctx.confirmation_prompt(f'Are you sure you want to delete {limit} message(s)?')
-        if (limit == 'all' or limit >= 10) and not await confirmation:
-            return
+        # only build the confirmation prompt when it will be awaited
+        if limit == 'all' or limit >= 10:
+            if not await ctx.confirmation_prompt(f'Are you sure you want to delete {limit} message(s)?'):
+                return
 
         if isinstance(limit, int):
             await ctx.channel.purge(limit=limit + 1)
@@ -200,23 +203,52 @@ class Moderation(commands.Cog):
             return
 
         async with ctx.typing():
-            matches = findall(r'(?<=<@!)?(?<=<@)?[0-9]{15,19}(?=>)?|\S.{1,31}?#[0-9]{4}', members)
-            remaining = sub(r'(<@!)?(<@)?[0-9]{15,19}>?|\S.{1,31}?#[0-9]{4}', '', members)
-            potential_members = matches + [x for x in remaining.split('\n') if x and x.strip()]
-            converted = [await AggressiveDefaultMemberConverter().convert(ctx, member) for member in potential_members]
-
-            success, failed = [], []
-
-            for member in converted:
-                if isinstance(member, discord.Member):
-                    try:
-                        await member.add_roles(role, reason=f'Bulk Added by {str(ctx.author)}')
-                    except discord.HTTPException:
-                        failed.append(str(member))
-                    else:
-                        success.append(str(member))
+            # a single scan collects IDs, mentions, and Name#Discriminator arguments, keeping the text between them
+            # as potential nicknames
+            matches, remaining, position = [], [], 0
+            for match in MEMBER_PATTERN.finditer(members):
+                matches.append(match.group(1) or match.group(2))
+                remaining.append(members[position:match.start()])
+                position = match.end()
+            remaining.append(members[position:])
+
+            potential_members = matches + [x for x in ''.join(remaining).split('\n') if x and x.strip()]
+            # conversions may fall back to member queries, so resolve every argument concurrently
+            # an unexpected conversion error (e.g. a member query timing out) only fails that argument
+            converter = AggressiveDefaultMemberConverter()
+            converted = await gather(
+                *(converter.convert(ctx, member) for member in potential_members), return_exceptions=True
+            )
+
+            async def add_role(member: discord.Member) -> bool:
+                """
+                Adds the role to a single member.
+
+                Parameters:
+                    member (discord.Member): The member to add the role to.
+
+                Returns:
+                    (bool): Whether the role was successfully added.
+                """
+
+                try:
+                    await member.add_roles(role, reason=f'Bulk Added by {str(ctx.author)}')
+                except discord.HTTPException:
+                    return False
                 else:
-                    failed.append(str(member))
+                    return True
+
+            # role additions are independent, so issue them concurrently and let discord.py handle rate limits
+            resolved = [x for x in converted if isinstance(x, discord.Member)]
+            results = await gather(*(add_role(x) for x in resolved))
+
+            success = [str(member) for member, added in zip(resolved, results) if added]
+            failed = [str(member) for member, added in zip(resolved, results) if not added]
+            failed.extend(
+                argument if isinstance(result, BaseException) else str(result)
+                for argument, result in zip(potential_members, converted)
+                if not isinstance(result, discord.Member)
+            )
 
             summary = f'Successfully added {role.mention} to the following members:\n' \
                       f'```{", ".join(success) if success else "None"}```\n'
@@ -248,16 +280,11 @@ class Moderation(commands.Cog):
 
         assert ctx.guild is not None  # guild only
 
-        if role := (await typed_retrieve_query(
-                self.bot.database,
-                int,
-                'SELECT ROLE_ID FROM DEFAULT_ROLES WHERE GUILD_ID=?',
-                (ctx.guild.id,))
-        ):
-            if fetched_role := ctx.guild.get_role(role[0]):
+        if role_id := self.bot.cache.default_roles.get(ctx.guild.id):
+            if fetched_role := ctx.guild.get_role(role_id):
                 await ctx.send(f'The default role for the server is **{fetched_role.name}**')
             else:
-                await ctx.send(f'The default role for the server has id `{role}`, but I was unable to fetch it.')
+                await ctx.send(f'The default role for the server has id `{role_id}`, but I was unable to fetch it.')
         else:
             await ctx.send(f'There is no default role set for the server.')
 
@@ -612,25 +612,25 @@ class ReactionRoles(commands.Cog):
         if payload.user_id == self.bot.user.id or payload.guild_id is None:
             return
 
-        if roles := await typed_retrieve_query(
-                self.bot.database,
-                int,
-                'SELECT ROLE_ID FROM REACTION_ROLES WHERE MESSAGE_ID=? AND REACTION=?',
-                (payload.message_id, str(payload.emoji))
-        ):
-            # if there's a role for the given message + reaction, attempt to fetch the guild
-            if guild := self.bot.get_guild(payload.guild_id):
-                # if we fetched the guild, try to fetch the member and the role
-                role = guild.get_role(roles[0])
-                member = guild.get_member(payload.user_id)
-                # if we fetched all our prerequisites, attempt to add the role to the member
-                if role and member:
-                    try:
-                        await member.add_roles(
-                            role, reason=f'Reaction Roles - Add [Message ID: {payload.message_id}]'
-                        )
-                    except discord.HTTPException as e:
-                        bot_logger.error(f'Reaction Role - Role Addition Failure. {e.status}. {e.text}')
+        # the cache mirrors REACTION_ROLES, so reactions on other messages never reach the database
+        role = self.bot.cache.reaction_roles.get((payload.message_id, str(payload.emoji)))
+        guild = self.bot.get_guild(payload.guild_id)
+
+        if not (role and guild):
+            return
+
+        member = guild.get_member(payload.user_id)
+        resolved_role = guild.get_role(role)
+
+        if not (member and resolved_role):
+            return
+
+        try:
+            await member.add_roles(
+                resolved_role, reason=f'Reaction Roles - Add [Message ID: {payload.message_id}]'
+            )
+        except discord.HTTPException as e:
+            bot_logger.error(f'Reaction Role - Role Addition Failure. {e.status}. {e.text}')
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent) -> None:
@@ -22,12 +22,12 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from asyncio import Event, TimeoutError
+from asyncio import Event, TimeoutError, gather
 from collections import defaultdict
 from contextlib import suppress
-from itertools import chain
+from itertools import chain, islice
 from json.decoder import JSONDecodeError
-from typing import List, Optional, Dict, Literal
+from typing import List, Optional, Dict, Literal, Iterable
 
 import aiosqlite
 import discord
@@ -40,7 +40,7 @@ from discord.utils import utcnow
 from humanfriendly import format_timespan
 
 from dreambot import DreamBot
-from utils.database.helpers import execute_query, typed_retrieve_query, typed_retrieve_one_query
+from utils.database.helpers import execute_query, execute_many_query, typed_retrieve_query, typed_retrieve_one_query
 from utils.database.table_dataclasses import RunescapeAlert
 from utils.enums.network_return_type import NetworkReturnType
 from utils.logging_formatter import bot_logger
@@ -281,11 +281,10 @@ class Runescape(commands.GroupCog, group_name='runescape', group_description='Co
                 alert.unpack(),
                 errors_to_suppress=aiosqlite.IntegrityError
             )
-        except aiosqliteError as e:
-            if isinstance(e, IntegrityError):
-                await interaction.response.send_message('You already have an alert for this item.', ephemeral=True)
-            else:
-                await interaction.response.send_message('Failed to create an alert for this item.', ephemeral=True)
+        except IntegrityError:
+            await interaction.response.send_message('You already have an alert for this item.', ephemeral=True)
+        except aiosqliteError:
+            await interaction.response.send_message('Failed to create an alert for this item.', ephemeral=True)
         else:
             await interaction.response.send_message('Successfully created alert.', ephemeral=True)
             self.alerts[interaction.user.id][item_id] = alert
@@ -488,14 +487,14 @@ class Runescape(commands.GroupCog, group_name='runescape', group_description='Co
             (List[Choice]): A list of relevant Choices for the current input.
         """
 
-        # check cache
-        if len(self.alerts[interaction.user.id]) == 0:
-            return []
+        # check cache - `get` avoids inserting an empty entry into the defaultdict for users without alerts
+        alerts = self.alerts.get(interaction.user.id)
 
-        alerts = self.alerts[interaction.user.id]
+        if not alerts:
+            return []
 
         if not current:
-            return [Choice(name=self.item_data[x.item_id].name, value=x.item_id) for x in list(alerts.values())[:25]]
+            return [Choice(name=self.item_data[x.item_id].name, value=x.item_id) for x in islice(alerts.values(), 25)]
 
         return generate_autocomplete_choices(
             current,
@@ -963,10 +962,24 @@ class Runescape(commands.GroupCog, group_name='runescape', group_description='Co
                     )
                 )
 
-        for user_id in embed_fragments:
-            await self.send_alert(user_id, embed_fragments[user_id])
+        # alerts are independent per user, so send them concurrently rather than waiting on each DM in turn
+        sent_alerts = list(chain.from_iterable(
+            await gather(*(self.send_alert(user_id, fragments) for user_id, fragments in embed_fragments.items()))
+        ))
+
+        if not sent_alerts:
+            return
+
+        # record every sent alert with a single writer, rather than one connection per user
+        now = int(utcnow().timestamp())
+        await record_alerts(self.bot.database, sent_alerts, now)
+
+        for sent_alert in sent_alerts:
+            self.alerts[sent_alert.owner_id][sent_alert.item_id].record_alert(now)
 
-    async def send_alert(self, user_id: int, alerts: dict[Literal['low', 'high'], List[AlertEmbedFragment]]) -> None:
+    async def send_alert(
+            self, user_id: int, alerts: dict[Literal['low', 'high'], List[AlertEmbedFragment]]
+    ) -> List[AlertEmbedFragment]:
         """
         Sends filtered and validated alerts to users.
 
@@ -975,13 +988,13 @@ class Runescape(commands.GroupCog, group_name='runescape', group_description='Co
             alerts (dict[Literal['low', 'high'], List[AlertEmbedFragment]]): A mapping containing alert fragments.
 
         Returns:
-            None.
+            (List[AlertEmbedFragment]): The alerts that were successfully sent.
         """
 
         user = self.bot.get_user(user_id)
         # TODO: failure logic (unavailable checks)
         if user is None:
-            return
+            return []
 
         embed = discord.Embed(
             title="Old School Runescape Market Alerts",
@@ -1017,12 +1030,9 @@ class Runescape(commands.GroupCog, group_name='runescape', group_description='Co
         try:
             await user.send(embed=embed)
         except discord.HTTPException:
-            pass
+            return []
         else:
-            now = int(utcnow().timestamp())
-            for alert in alerts['high'] + alerts['low']:
-                await record_alert(self.bot.database, alert.owner_id, alert.item_id, now)
-                self.alerts[alert.owner_id][alert.item_id].record_alert(now)
+            return alerts['high'] + alerts['low']
 
     async def cog_unload(self) -> None:
         """
@@ -1042,28 +1052,30 @@ class Runescape(commands.GroupCog, group_name='runescape', group_description='Co
         bot_logger.info('Completed Unload for Cog: Runescape')
 
 
-async def record_alert(database: str, user_id: int, item_id: int, last_alert_time: int) -> None:
+async def record_alerts(database: str, alerts: Iterable[AlertEmbedFragment], last_alert_time: int) -> None:
     """
-    Attempts to increment the usage count of an alert.
+    Attempts to increment the usage count of each sent alert in a single transaction.
 
     Parameters:
         database (str): The name of the bot's database.
-        user_id (str): The user_id of the alert.
-        item_id (int): The item_id of the alert.
+        alerts (Iterable[AlertEmbedFragment]): The alerts that were sent.
         last_alert_time (int): The time of the last alert.
 
     Returns:
         None.
     """
 
+    alerts = list(alerts)
+
     try:
-        await execute_query(
+        await execute_many_query(
             database,
             'UPDATE RUNESCAPE_ALERTS SET CURRENT_ALERTS=CURRENT_ALERTS+1, LAST_ALERT=? WHERE OWNER_ID=? AND ITEM_ID=?',
-            (last_alert_time, user_id, item_id)
+            ((last_alert_time, alert.owner_id, alert.item_id) for alert in alerts),
+            errors_to_suppress=aiosqliteError
         )
-    except aiosqliteError:
-        pass
+    except aiosqliteError as e:
+        bot_logger.error(f'Failed to record {len(alerts)} sent Runescape alert(s). {e}.')
 
 
 def percentage_change(start: int, final: int) -> str:
@@ -147,11 +147,14 @@ class Utility(commands.Cog):
             embed.set_thumbnail(url=user.avatar.url)
         embed.add_field(name='Account Created', value=format_dt(user.created_at, 'R'))
         embed.add_field(name='Joined Server', value=format_dt(user.joined_at, 'R')) if user.joined_at else 'Unknown'
-        members = sorted(ctx.guild.members, key=lambda x: x.joined_at or discord.utils.utcnow())
-        embed.add_field(name='Join Position', value=str(members.index(user)))
+        # count earlier joins rather than sorting every member of the guild to find a single index
+        joined_at = user.joined_at or discord.utils.utcnow()
+        join_position = sum(1 for x in ctx.guild.members if x.joined_at is not None and x.joined_at < joined_at)
+        embed.add_field(name='Join Position', value=str(join_position))
         embed.add_field(name='User ID', value=str(user.id), inline=False)
         embed.add_field(name='User Flags', value=readable_flags(user.public_flags), inline=False)
-        roles = ', '.join(str(x) for x in (user.roles[::-1])[:-1])
+        # highest role first, excluding @everyone (always the lowest)
+        roles = ', '.join(str(x) for x in user.roles[:0:-1])
         embed.add_field(name='Roles', value=roles if roles else 'None', inline=False)
         embed.set_footer(text="Please report any issues to my owner!")
 
@@ -280,7 +280,6 @@ class VoiceRoles(commands.Cog):
         else:
             await ctx.send('Could not find any voice roles associated with the specified channel.')
 
-    # noinspection PyUnusedLocal
     @commands.Cog.listener()
     async def on_voice_state_update(
             self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState
@@ -290,13 +289,17 @@ class VoiceRoles(commands.Cog):
 
         Parameters:
             member (discord.Member): The member whose voice state was updated.
-            before (discord.VoiceState): Not used.
+            before (discord.VoiceState): The previous voice state for the member.
             after (discord.VoiceState): The updated voice state for the member.
 
         Returns:
             None.
         """
 
+        # reject updates that can't change roles (e.g. mute or deafen) before waiting out the cache or editing roles
+        if before.channel == after.channel or not self.bot.cache.voice_roles.get(member.guild.id):
+            return
+
         if not member.guild.me.guild_permissions.manage_roles:
             return
 
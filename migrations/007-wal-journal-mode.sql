@@ -0,0 +1,7 @@
+-- Revises: 006
+-- Creation Date: 2026-10-18 15:21:08 UTC
+-- Reason: Switch the Database to Write-Ahead Logging
+
+PRAGMA journal_mode = WAL;
+
+PRAGMA user_version = 7;
\ No newline at end of file
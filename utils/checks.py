@@ -31,6 +31,7 @@ from utils.context import Context
 from utils.cooldowns import cooldown_predicate
 
 ForbiddenCharacters = set('*_~#/\`><@')
+MEMECOIN_CHANNEL_ID = 636356259255287808
 
 
 # Checks are missing type specialization -> discord.ext.commands._types not exported
@@ -109,7 +110,7 @@ def check_memecoin_channel() -> Callable[[Any], Any]:
             (bool): Whether the invocation channel is the authorized MemeCoin channel.
         """
 
-        return ctx.message.channel.id == 636356259255287808
+        return ctx.channel.id == MEMECOIN_CHANNEL_ID
 
     return commands.check(predicate)
 
@@ -152,7 +153,8 @@ def guild_only(guild_id: Union[int, List[int]]) -> Callable[[Any], Any]:
         (Callable[[], Context]): The resulting wrapped predicate.
     """
 
-    guild_ids = guild_id if isinstance(guild_id, list) else [guild_id]
+    # resolved once at decoration time, so each invocation is a single hashed membership test
+    guild_ids = frozenset(guild_id) if isinstance(guild_id, list) else frozenset((guild_id,))
 
     def predicate(ctx: Context) -> bool:
         """
@@ -44,7 +44,7 @@ class TableCache:
         reaction_roles (Dict[Tuple[int, str], int]): A (Message.id, Reaction): Role.id mapping.
         voice_roles (DefaultDict[int, List[TableDC.VoiceRole]]): A Guild.id: VoiceRole mapping.
         default_roles (Dict[int, int]): A Guild.id: Role.id mapping.
-        guild_features (Dict[int: int]): A Guild.id: Feature{IntFlag} mapping.
+        guild_features (Dict[int, int]): A Guild.id: Features (bitmask) mapping.
     """
 
     def __init__(self, database: str) -> None:
@@ -90,10 +90,7 @@ class TableCache:
             prefix_rows = await typed_retrieve_query(self.database, TableDC.Prefix, 'SELECT * FROM PREFIXES')
 
             for row in prefix_rows:
-                if row.guild_id in self.prefixes:
-                    self.prefixes[row.guild_id].append(row.prefix)
-                else:
-                    self.prefixes[row.guild_id] = [row.prefix]
+                self.prefixes.setdefault(row.guild_id, []).append(row.prefix)
 
         except aiosqliteError as e:
             bot_logger.error(f'Failed Prefix retrieval. {e}')
@@ -112,7 +109,7 @@ class TableCache:
             None.
         """
 
-        current_reaction_roles = deepcopy(self.reaction_roles)
+        current_reaction_roles = self.reaction_roles.copy()
 
         try:
             self.reaction_roles.clear()
@@ -167,7 +164,7 @@ class TableCache:
             None.
         """
 
-        current_default_roles = deepcopy(self.default_roles)
+        current_default_roles = self.default_roles.copy()
 
         try:
             self.default_roles.clear()
@@ -194,7 +191,7 @@ class TableCache:
             None.
         """
 
-        current_guild_features = deepcopy(self.guild_features)
+        current_guild_features = self.guild_features.copy()
 
         try:
             self.guild_features.clear()
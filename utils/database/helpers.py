@@ -77,6 +77,47 @@ async def execute_query(
         raise error
 
 
+async def execute_many_query(
+        database: str,
+        query: str,
+        values: Iterable[Tuple[Any, ...]],
+        *,
+        errors_to_suppress: Optional[Union[Type[aiosqlite.Error], Tuple[Type[aiosqlite.Error], ...]]] = None
+) -> Optional[int]:
+    """
+    A method that executes a sqlite3 statement against each set of values in a single transaction.
+    Note: Use execute_query() for statements that only need to be executed once.
+
+    Parameters:
+        database (str): The name of the bot's database.
+        query (str): The statement to execute.
+        values (Iterable[Tuple[Any, ...]]): The sets of values to insert into the query.
+        errors_to_suppress (Optional[Union[Type[aiosqlite.Error], Tuple[Type[aiosqlite.Error], ...]]]): Errors that
+            should be suppressed during execution.
+
+    Raises:
+        aiosqlite.Error.
+
+    Returns:
+        (Optional[int]): The number of affected rows.
+    """
+
+    if errors_to_suppress is None:
+        errors_to_suppress = tuple()
+
+    try:
+        async with aiosqlite.connect(database) as connection:
+            await connection.execute('PRAGMA foreign_keys = ON')
+            affected = await connection.executemany(query, values)
+            await connection.commit()
+            return affected.rowcount
+
+    except aiosqlite.Error as error:
+        if not isinstance(error, errors_to_suppress):
+            bot_logger.error(f'Execute Many Query ("{query}"). {error}.')
+        raise error
+
+
 async def retrieve_query(
         database: str, query: str, values: Optional[Tuple[Any, ...]] = None
 ) -> Iterable[Tuple[Any, ...]]:
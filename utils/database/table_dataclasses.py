@@ -80,6 +80,8 @@ class DatabaseDataclass:
     def unpack(self) -> Tuple[Any, ...]:
         """
         Unpacks the dataclass as a tuple.
+        Fields are primitive column values, so a shallow unpack is equivalent to (and cheaper than) `astuple`, which
+        recursively deep-copies each value.
 
         Parameters:
             None.
@@ -88,7 +90,7 @@ class DatabaseDataclass:
             (Tuple[Any, ...]): The unpacked dataclass.
         """
 
-        return dataclasses.astuple(self)
+        return tuple(getattr(self, field.name) for field in dataclasses.fields(self))
 
 
 @dataclasses.dataclass
@@ -23,7 +23,7 @@ SOFTWARE.
 """
 
 from enum import IntEnum, auto
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class GuildFeature(IntEnum):
@@ -34,6 +34,12 @@ class GuildFeature(IntEnum):
     TAG_DIRECT_INVOKE = auto()
 
 
+# GuildFeature is fixed at import time, so the (name, bitmask) pairs can be computed once
+GUILD_FEATURE_MASKS: Tuple[Tuple[str, int], ...] = tuple(
+    (feature.name, 1 << feature.value - 1) for feature in GuildFeature
+)
+
+
 def has_guild_feature(features: int, feature: GuildFeature) -> bool:
     """
     Checks whether the feature is active for this guild.
@@ -22,9 +22,10 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 from io import BytesIO
 from os import path
-from re import search
+from re import compile as re_compile
 from textwrap import wrap
 from typing import List, Tuple, Union
 
@@ -36,9 +37,32 @@ from discord.ext.commands import MissingRequiredArgument, BadArgument
 from discord.ext.commands import Parameter
 
 from utils.enums.network_return_type import NetworkReturnType
-from utils.network_utils import network_request
+from utils.network_utils import network_request, ResponseSizeExceeded
 from utils.utils import run_in_executor
 
+MAX_IMAGE_SIZE = 8000000
+IMAGE_DOWNLOAD_TIMEOUT = 15
+IMAGE_EXTENSION_PATTERN = re_compile(r'.(webp|jpeg|jpg|png|bmp)')
+# per-band lookup table for Image.point: inverts the R, G, and B bands and preserves the alpha band
+RGBA_INVERSION_TABLE = [255 - x for x in range(256)] * 3 + list(range(256))
+
+
+def is_image_source(source: Union[discord.Message, str]) -> bool:
+    """
+    A method that checks whether a source could provide an image, without performing any network requests.
+
+    Parameters:
+        source (Union[discord.Message, str]): The image source. Could be an attachment or url.
+
+    Returns:
+        (bool): Whether extract_image_as_bytes should attempt to download the source.
+    """
+
+    if isinstance(source, discord.Message):
+        return bool(source.attachments)
+
+    return IMAGE_EXTENSION_PATTERN.search(source) is not None
+
 
 async def extract_image_as_bytes(session: ClientSession, source: Union[discord.Message, str]) -> BytesIO:
     """
@@ -48,27 +72,37 @@ async def extract_image_as_bytes(session: ClientSession, source: Union[discord.M
         session (aiohttp.ClientSession): The bot's current client session.
         source (Union[discord.Message, str]): The image source. Could be an attachment or url.
 
+    Raises:
+        (NoImage): The source does not contain an image.
+        (BufferSizeExceeded): The image exceeds MAX_IMAGE_SIZE.
+        (asyncio.TimeoutError): The image could not be downloaded within IMAGE_DOWNLOAD_TIMEOUT seconds.
+
     Returns:
         buffer (BytesIO): A BytesIO object of the image data.
     """
 
     if isinstance(source, discord.Message) and source.attachments:
-        buffer = BytesIO()
-        await source.attachments[0].save(buffer)
-        if buffer.getbuffer().nbytes >= 8000000:
+        attachment = source.attachments[0]
+
+        # discord reports the attachment's size, so oversized attachments can be rejected without downloading them
+        if attachment.size >= MAX_IMAGE_SIZE:
             raise BufferSizeExceeded
-        else:
-            return buffer
-    elif isinstance(source, str) and search(r'.(webp|jpeg|jpg|png|bmp)', source):
-        # if the user provided an embed, refresh to allow discord time to update the message
+
         buffer = BytesIO()
-        data = await network_request(session, source, return_type=NetworkReturnType.BYTES)
-        buffer.write(data)
-        buffer.seek(0)
-        if buffer.getbuffer().nbytes >= 8000000:
+        await attachment.save(buffer)
+        return buffer
+    elif isinstance(source, str) and IMAGE_EXTENSION_PATTERN.search(source):
+        # if the user provided an embed, refresh to allow discord time to update the message
+        # bound how long a slow (or deliberately stalling) host can hold the command
+        try:
+            data = await asyncio.wait_for(
+                network_request(session, source, return_type=NetworkReturnType.BYTES, size_limit=MAX_IMAGE_SIZE),
+                IMAGE_DOWNLOAD_TIMEOUT
+            )
+        except ResponseSizeExceeded:
             raise BufferSizeExceeded
-        else:
-            return buffer
+
+        return BytesIO(data)
     else:
         raise NoImage('source')
 
@@ -88,18 +122,20 @@ def invert_object(file: BytesIO) -> BytesIO:
     """
 
     inverted_buffer = BytesIO()
-    image = Image.open(file)
+    image: Image.Image = Image.open(file)
+
+    # ImageOps.invert only supports single-band and RGB images; normalize anything else (e.g. palette GIFs) first
+    if image.mode not in ('1', 'L', 'RGB', 'RGBA'):
+        image = image.convert('RGBA' if image.has_transparency_data else 'RGB')
 
     if image.mode == 'RGBA':
-        r, g, b, a = image.split()
-        rgb_image = Image.merge('RGB', (r, g, b))
-        inverted_image = PIL.ImageOps.invert(rgb_image)
-        r2, g2, b2 = inverted_image.split()
-        final_transparent_image = Image.merge('RGBA', (r2, g2, b2, a))
-        final_transparent_image.save(inverted_buffer, format='PNG')
+        # a single pass over the pixel data, rather than splitting and merging the bands twice
+        inverted_image = image.point(RGBA_INVERSION_TABLE)
     else:
         inverted_image = PIL.ImageOps.invert(image)
-        inverted_image.save(inverted_buffer, format='PNG')
+
+    # zlib dominates encode time at the default level (6); level 1 roughly halves it for a modestly larger file
+    inverted_image.save(inverted_buffer, format='PNG', compress_level=1)
 
     inverted_buffer.seek(0)
     return inverted_buffer
@@ -22,38 +22,48 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from dataclasses import dataclass, field
-from typing import Set, Optional
+from typing import Dict, KeysView, Optional
 
 from utils.database.table_dataclasses import Group
 
 
-@dataclass
 class CompositeGroup:
     """
-    A dataclass that joins Groups and the id's of Group Members.
+    A class that joins Groups and the id's of Group Members.
+    Uses `__slots__`, since an instance is held in memory for every group the bot knows of.
 
     Attributes:
         group (Group): The raw group.
-        members (Set[int]): The ids of the members of the group.
+        joined (Dict[int, int]): A Member.id: Joined (unix timestamp) mapping for the members of the group.
     """
 
-    group: Group
-    members: Set[int] = field(default_factory=set, init=False)
+    __slots__ = ('group', 'joined')
 
-    def add_member(self, member_id: int) -> None:
+    def __init__(self, group: Group) -> None:
+        """
+        The constructor for the CompositeGroup class.
+
+        Parameters:
+            group (Group): The raw group.
+        """
+
+        self.group = group
+        self.joined: Dict[int, int] = {}
+
+    def add_member(self, member_id: int, joined: int) -> None:
         """
         Adds a member to this group.
 
         Parameters:
             member_id (int): The id of the member.
+            joined (int): The time the member joined the group.
 
         Returns:
             None.
         """
 
         self.group.current_members += 1
-        self.members.add(member_id)
+        self.joined[member_id] = joined
 
     def remove_member(self, member_id: int) -> None:
         """
@@ -67,7 +77,21 @@ class CompositeGroup:
         """
 
         self.group.current_members -= 1
-        self.members.discard(member_id)
+        self.joined.pop(member_id, None)
+
+    @property
+    def members(self) -> KeysView[int]:
+        """
+        Quick access to the ids of the group's members.
+
+        Parameters:
+            None.
+
+        Returns:
+            (KeysView[int]).
+        """
+
+        return self.joined.keys()
 
     @property
     def group_name(self) -> str:
@@ -152,3 +176,17 @@ class CompositeGroup:
         """
 
         return self.group.max_members
+
+    @property
+    def max_members_display(self) -> str:
+        """
+        Quick access to the group's max_members property, formatted for display.
+
+        Parameters:
+            None.
+
+        Returns:
+            (str).
+        """
+
+        return f'{self.group.max_members:,}' if self.group.max_members is not None else '∞'
@@ -22,14 +22,15 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import atexit
 import datetime
 import logging
 import os
 from contextlib import suppress
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Tuple
 
-import discord
-
 cyan = '\x1b[36m'
 yellow = '\x1b[33;20m'
 blue = '\x1b[34m'
@@ -69,7 +70,6 @@ def format_loggers() -> None:
             (cyan, cyan, yellow, red, red)
         )
     )
-    logger.addHandler(handler)
 
     bot_file_handler = logging.FileHandler(os.path.join(file_path, file_time_name))
     bot_file_handler.setLevel(logging.INFO)
@@ -79,22 +79,21 @@ def format_loggers() -> None:
             '%(asctime)s: %(levelname)s [DreamBot] - %(message)s (%(filename)s:%(funcName)s:%(lineno)d)'
         )
     )
-    logger.addHandler(bot_file_handler)
+    attach_queued_handlers(logger, handler, bot_file_handler)
 
     # set up discord handlers
+    discord_logger = logging.getLogger('discord')
+    discord_logger.setLevel(logging.INFO)
     discord_handler = logging.StreamHandler()
     discord_handler.setLevel(logging.INFO)
     discord_handler.addFilter(NoResumeFilter())
-    discord.utils.setup_logging(
-        formatter=StreamLoggingFormatter(
+    discord_handler.setFormatter(
+        StreamLoggingFormatter(
             '%(asctime)s: %(levelname)s [discord.py] - %(message)s (%(filename)s)',
             '%(asctime)s: %(levelname)s [discord.py] - %(message)s (%(filename)s:%(funcName)s:%(lineno)d)',
             (blue, blue, yellow, red, red)
-        ),
-        handler=discord_handler,
-        root=False
+        )
     )
-    discord_logger = logging.getLogger('discord')
 
     discord_file_handler = logging.FileHandler(os.path.join(file_path, file_time_name))
     discord_file_handler.setLevel(logging.INFO)
@@ -105,7 +104,29 @@ def format_loggers() -> None:
         )
     )
 
-    discord_logger.addHandler(discord_file_handler)
+    attach_queued_handlers(discord_logger, discord_handler, discord_file_handler)
+
+
+def attach_queued_handlers(logger: logging.Logger, *handlers: logging.Handler) -> None:
+    """
+    Attaches handlers to a logger through a queue, so that stream and file writes happen on a background thread
+    rather than blocking the event loop.
+
+    Parameters:
+        logger (logging.Logger): The logger to attach the handlers to.
+        handlers (logging.Handler): The handlers that ultimately emit the logger's records.
+
+    Returns:
+        None.
+    """
+
+    log_queue: 'SimpleQueue[logging.LogRecord]' = SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    logger.addHandler(RecordQueueHandler(log_queue))
+    listener.start()
+    # flush any remaining records on shutdown
+    atexit.register(listener.stop)
 
 
 class StreamLoggingFormatter(logging.Formatter):
@@ -237,3 +258,27 @@ class NoResumeFilter(logging.Filter):
         """
 
         return 'RESUMED' not in record.getMessage()
+
+
+class RecordQueueHandler(QueueHandler):
+    """
+    A logging.handlers.QueueHandler that enqueues records as-is.
+    The default implementation formats records before enqueuing them, which would bake the message and traceback
+    together before the listener's formatters apply their own layouts.
+
+    Attributes:
+        None.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepares a record for queuing. Records are consumed in-process, so no preparation is necessary.
+
+        Parameters:
+            record (logging.LogRecord): The logging record for an event.
+
+        Returns:
+            (logging.LogRecord): The unmodified record.
+        """
+
+        return record
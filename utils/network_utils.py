@@ -51,7 +51,8 @@ async def network_request(
         headers: Optional[Headers] = None,
         raise_errors: Optional[bool] = True,
         ssl: Optional[bool] = None,
-        return_type: NetworkReturnType = NetworkReturnType.TEXT
+        return_type: NetworkReturnType = NetworkReturnType.TEXT,
+        size_limit: Optional[int] = None
 ) -> Any:
     """
     A method that downloads an image from an url.
@@ -64,9 +65,11 @@ async def network_request(
         raise_errors (Optional[bool]): Whether responses with statuses >= 400 should raise an exception.
         ssl (Optional[bool]): Whether ssl should be used for the request.
         return_type (NetworkReturnType): The type of data to coerce the response to.
+        size_limit (Optional[int]): If specified, (bytes) responses of this size or larger are rejected.
 
     Raises:
         aiohttp.ClientResponseError
+        ResponseSizeExceeded
 
     Returns:
         (Optional[Union[str, bytes, Dict[Any, Optional[Any]]]]) The request's response.
@@ -77,7 +80,26 @@ async def network_request(
             if return_type == NetworkReturnType.JSON:
                 return await r.json(encoding=encoding)
             elif return_type == NetworkReturnType.BYTES:
-                return await r.read()
+                if size_limit is None:
+                    return await r.read()
+
+                # reject oversized responses without downloading them (or before downloading all of them)
+                if r.content_length is not None and r.content_length >= size_limit:
+                    raise ResponseSizeExceeded
+
+                # joining the chunks once copies the body a single time (appending to a bytearray, then converting
+                # it to bytes, would copy it twice)
+                chunks = []
+                received = 0
+
+                async for chunk in r.content.iter_chunked(65536):
+                    chunks.append(chunk)
+                    received += len(chunk)
+
+                    if received >= size_limit:
+                        raise ResponseSizeExceeded
+
+                return b''.join(chunks)
             else:
                 return await r.text(encoding=encoding)
 
@@ -91,6 +113,14 @@ async def network_request(
             raise
 
 
+class ResponseSizeExceeded(Exception):
+    """
+    Error raised when a response's size exceeds the requested size limit.
+    """
+
+    pass
+
+
 class ExponentialBackoff:
     """
     An Exponential Backoff implementation for network requests.
@@ -24,9 +24,11 @@ SOFTWARE.
 
 import asyncio
 import functools
+import heapq
 import subprocess
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from re import search
 from typing import (
     List, Sequence, Any, Iterator, Tuple, Callable, Awaitable, Optional, Literal, TypeVar, Union, Generic, Iterable
@@ -315,8 +317,9 @@ def generate_autocomplete_choices(
     limit = max(1, min(25, limit))  # clamp to [1, 25]
     minimum_threshold = max(0, min(200, minimum_threshold))  # clamp to [0, 200]
 
-    autocomplete_models = [AutocompleteModel(current, *x) for x in items]
-    valid_models = [x for x in autocomplete_models if x.ratio >= minimum_threshold]
-    ratios = sorted(valid_models, reverse=True)
+    autocomplete_models = (AutocompleteModel(current, *x) for x in items)
+    valid_models = (x for x in autocomplete_models if x.ratio >= minimum_threshold)
+    # only the top `limit` models are ever returned; avoid sorting every candidate
+    ratios = heapq.nlargest(limit, valid_models, key=attrgetter('ratio'))
 
-    return [x.to_choice() for x in ratios[:limit]]
+    return [x.to_choice() for x in ratios]